@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import logging
+from typing import Any
 from typing import Tuple
 
 import jax
@@ -29,31 +30,38 @@ from evojax.util import get_params_format_fn
 
 class CNN(nn.Module):
     """CNN for MNIST."""
+    dtype: Any = jnp.float32
 
     @nn.compact
     def __call__(self, x):
-        x = nn.Conv(features=8, kernel_size=(5, 5), padding='SAME')(x)
+        x = x.astype(self.dtype)
+        x = nn.Conv(features=8, kernel_size=(5, 5), padding='SAME',
+                    dtype=self.dtype)(x)
         x = nn.relu(x)
         x = nn.max_pool(x, window_shape=(2, 2), strides=(2, 2))
-        x = nn.Conv(features=16, kernel_size=(5, 5), padding='SAME')(x)
+        x = nn.Conv(features=16, kernel_size=(5, 5), padding='SAME',
+                    dtype=self.dtype)(x)
         x = nn.relu(x)
         x = nn.max_pool(x, window_shape=(2, 2), strides=(2, 2))
         x = x.reshape((x.shape[0], -1))  # flatten
-        x = nn.Dense(features=10)(x)
-        x = nn.log_softmax(x)
+        x = nn.Dense(features=10, dtype=self.dtype)(x)
+        # Parameters are kept in float32, only the computation uses dtype.
+        x = nn.log_softmax(x.astype(jnp.float32))
         return x
 
 
 class ConvNetPolicy(PolicyNetwork):
     """A convolutional neural network for the MNIST classification task."""
 
-    def __init__(self, logger: logging.Logger = None):
+    def __init__(self,
+                 dtype: Any = jnp.float32,
+                 logger: logging.Logger = None):
         if logger is None:
             self._logger = create_logger('ConvNetPolicy')
         else:
             self._logger = logger
 
-        model = CNN()
+        model = CNN(dtype=dtype)
         params = model.init(random.PRNGKey(0), jnp.zeros([1, 28, 28, 1]))
         self.num_params, format_params_fn = get_params_format_fn(params)
         self._logger.info(
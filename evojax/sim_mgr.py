@@ -84,7 +84,7 @@ def duplicate_params(params: jnp.ndarray,
         return jnp.repeat(params, repeats=repeats, axis=0)
 
 
-@jax.jit
+@partial(jax.jit, donate_argnums=(0, 2))
 def update_score_and_mask(score, reward, mask, done):
     new_score = score + reward * mask
     new_mask = mask * (1 - done.ravel())
@@ -14,6 +14,7 @@
 
 import sys
 import numpy as np
+from functools import lru_cache
 from typing import Tuple
 
 import jax
@@ -35,15 +36,20 @@ def sample_batch(key: jnp.ndarray,
                  data: jnp.ndarray,
                  labels: jnp.ndarray,
                  batch_size: int) -> Tuple:
-    ix = random.choice(
-        key=key, a=data.shape[0], shape=(batch_size,), replace=False)
+    # Sampling with replacement is O(batch_size), whereas replace=False
+    # permutes the whole dataset on every reset.
+    ix = random.randint(
+        key=key, shape=(batch_size,), minval=0, maxval=data.shape[0])
     return (jnp.take(data, indices=ix, axis=0),
             jnp.take(labels, indices=ix, axis=0))
 
 
 def loss(prediction: jnp.ndarray, target: jnp.ndarray) -> jnp.float32:
-    target = jax.nn.one_hot(target, 10)
-    return -jnp.mean(jnp.sum(prediction * target, axis=1))
+    # Gather the target log-probabilities directly instead of a one-hot
+    # multiply-and-sum over all classes.
+    target_log_probs = jnp.take_along_axis(
+        prediction, target[:, None], axis=1)
+    return -jnp.mean(target_log_probs)
 
 
 def accuracy(prediction: jnp.ndarray, target: jnp.ndarray) -> jnp.float32:
@@ -51,6 +57,30 @@ def accuracy(prediction: jnp.ndarray, target: jnp.ndarray) -> jnp.float32:
     return jnp.mean(predicted_class == target)
 
 
+@lru_cache(maxsize=None)
+def load_data(test: bool) -> Tuple[jnp.ndarray, jnp.ndarray]:
+    """Load the MNIST split once per process and keep it on device."""
+
+    # Delayed importing of torchvision
+
+    try:
+        from torchvision import datasets
+    except ModuleNotFoundError:
+        print('You need to install torchvision for this task.')
+        print('  pip install torchvision')
+        sys.exit(1)
+
+    dataset = datasets.MNIST('./data', train=not test, download=True)
+    # Move the dataset onto the device once so that the jitted reset_fn
+    # indexes device-resident arrays instead of re-uploading host data.
+    # The raw uint8 images are uploaded and normalized in float32 on device,
+    # which avoids a float64 copy of the whole split on the host.
+    data = jax.device_put(np.expand_dims(dataset.data.numpy(), axis=-1))
+    data = data.astype(jnp.float32) * (1. / 255.)
+    labels = jax.device_put(dataset.targets.numpy())
+    return data, labels
+
+
 class MNIST(VectorizedTask):
     """MNIST classification task."""
 
@@ -62,18 +92,7 @@ class MNIST(VectorizedTask):
         self.obs_shape = tuple([28, 28, 1])
         self.act_shape = tuple([10, ])
 
-        # Delayed importing of torchvision
-
-        try:
-            from torchvision import datasets
-        except ModuleNotFoundError:
-            print('You need to install torchvision for this task.')
-            print('  pip install torchvision')
-            sys.exit(1)
-
-        dataset = datasets.MNIST('./data', train=not test, download=True)
-        data = np.expand_dims(dataset.data.numpy() / 255., axis=-1)
-        labels = dataset.targets.numpy()
+        data, labels = load_data(test)
 
         def reset_fn(key):
             if test:
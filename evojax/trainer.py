@@ -174,6 +174,7 @@ class Trainer(object):
                     best_params = self.solver.best_params
                     test_scores, _ = self.sim_mgr.eval_params(
                         params=best_params, test=True)
+                    test_scores = np.array(test_scores)
                     self._logger.info(
                         '[TEST] Iter={0}, #tests={1}, max={2:.4f} avg={3:.4f}, '
                         'min={4:.4f}, std={5:.4f}'.format(
@@ -195,6 +196,7 @@ class Trainer(object):
             best_params = self.solver.best_params
             test_scores, _ = self.sim_mgr.eval_params(
                 params=best_params, test=True)
+            test_scores = np.array(test_scores)
             self._logger.info(
                 '[TEST] Iter={0}, #tests={1}, max={2:.4f}, avg={3:.4f}, '
                 'min={4:.4f}, std={5:.4f}'.format(
@@ -144,6 +144,8 @@ def get_tensorboard_log_fn(
         from torch.utils.tensorboard import SummaryWriter
 
         def log_with_pytorch(i: int, scores: jnp.ndarray, stage: str):
+            # Fetch once; the statistics below are then host-side.
+            scores = np.asarray(scores)
             with SummaryWriter(log_dir=log_dir) as writer:
                 writer.add_scalar(
                     f"{stage}/score_min", scores.min().item(), global_step=i)
@@ -154,7 +156,7 @@ def get_tensorboard_log_fn(
                 writer.add_scalar(
                     f"{stage}/score_std", scores.std().item(), global_step=i)
                 writer.add_histogram(
-                    f"{stage}/score_distribution", np.array(scores),
+                    f"{stage}/score_distribution", scores,
                     global_step=i)
 
         return log_with_pytorch
@@ -166,6 +168,8 @@ def get_tensorboard_log_fn(
         import tensorflow as tf
 
         def log_with_tf(i: int, scores: jnp.ndarray, stage: str):
+            # Fetch once; the statistics below are then host-side.
+            scores = np.asarray(scores)
             with tf.summary.SummaryWriter(log_dir=log_dir).as_default():
                 tf.summary.scalar(
                     f"{stage}/score_min", scores.min().item(), step=i)
@@ -176,7 +180,7 @@ def get_tensorboard_log_fn(
                 tf.summary.scalar(
                     f"{stage}/score_std", scores.std().item(), step=i)
                 tf.summary.histogram(
-                    f"{stage}/score_distribution", np.array(scores), step=i)
+                    f"{stage}/score_distribution", scores, step=i)
 
         return log_with_tf
 
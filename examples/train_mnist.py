@@ -21,6 +21,8 @@ import argparse
 import os
 import shutil
 
+import jax.numpy as jnp
+
 from evojax import Trainer
 from evojax.task.mnist import MNIST
 from evojax.policy.convnet import ConvNetPolicy
@@ -48,6 +50,8 @@ def parse_args():
         '--std-lr', type=float, default=0.089, help='Std learning rate.')
     parser.add_argument(
         '--init-std', type=float, default=0.039, help='Initial std.')
+    parser.add_argument(
+        '--bf16', action='store_true', help='Run the CNN in bfloat16.')
     parser.add_argument(
         '--gpu-id', type=str, help='GPU(s) to use.')
     parser.add_argument(
@@ -65,7 +69,8 @@ def main(config):
     logger.info('EvoJAX MNIST Demo')
     logger.info('=' * 30)
 
-    policy = ConvNetPolicy(logger=logger)
+    policy = ConvNetPolicy(
+        dtype=jnp.bfloat16 if config.bf16 else jnp.float32, logger=logger)
     train_task = MNIST(batch_size=config.batch_size, test=False)
     test_task = MNIST(batch_size=config.batch_size, test=True)
     solver = PGPE(